@@ -1,96 +1,453 @@
 import asyncio
+import ipaddress
 import json
+import logging
+import re
 import socket
-from typing import Optional, Any
+import struct
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Any
 
-from fastapi import FastAPI, HTTPException, Depends, Form, Query
+import anyio.to_thread
+import orjson
+from cachetools import TTLCache
+from pydantic import TypeAdapter
+from fastapi import FastAPI, HTTPException, Depends, Form, Query, Response
+from fastapi.openapi.utils import get_openapi
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine, select
 
 from protocol_proxy.bacnet_manager import AsyncioBACnetManager
-from protocol_proxy.manager import ProtocolProxyManager
-from protocol_proxy.bacnet_proxy import BACnetProxy
 from protocol_proxy.ipc import ProtocolProxyMessage
 
 from .models import (
-    IPAddress, LocalIPResponse, ProxyResponse, ScanResponse, 
+    BACnetDevice, IPAddress, LocalIPResponse, ProxyResponse, ScanResponse,
     PropertyReadResponse, DevicePropertiesResponse, WhoIsResponse, PingResponse,
-    ObjectListNamesResponse, PaginationInfo
+    ObjectListNamesResponse, ObjectEntry, PaginationInfo, DeviceCache
 )
 
-# TODO handle who is AND just one device.
-app = FastAPI()
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    # Windows (or uvloop otherwise unavailable); keep the default loop.
+    pass
+
+try:
+    from icmplib import SocketPermissionError, async_ping
+except ImportError:
+    async_ping = None
+    SocketPermissionError = None
+
+try:
+    import netifaces
+except ImportError:
+    netifaces = None
+
+# Interface enumeration walks kernel structures on every call; refresh the
+# ip -> (iface, netmask) map at most every 30 seconds.
+_IFACE_TTL = 30
+_iface_cache = {'ts': 0.0, 'by_ip': {}}
 
-# SQLite database setup
+
+def _iface_map():
+    """Return a cached {ip: (iface, netmask)} map of IPv4 interfaces."""
+    now = time.monotonic()
+    if now - _iface_cache['ts'] > _IFACE_TTL:
+        by_ip = {}
+        for iface in netifaces.interfaces():
+            addrs = netifaces.ifaddresses(iface)
+            for addr in addrs.get(netifaces.AF_INET, []):
+                ip = addr.get('addr')
+                if ip and ip not in by_ip:
+                    by_ip[ip] = (iface, addr.get('netmask'))
+        _iface_cache['by_ip'] = by_ip
+        _iface_cache['ts'] = now
+    return _iface_cache['by_ip']
+
+# SQLite database setup. The default QueuePool keeps warm connections and
+# hands each checkout its own, so sessions on different worker threads
+# never share a DBAPI connection; check_same_thread off just lets a pooled
+# connection be reused from whichever thread checks it out.
 DATABASE_URL = "sqlite:///./bacnet.db"
-engine = create_engine(DATABASE_URL)
+engine = create_engine(DATABASE_URL,
+                       connect_args={"check_same_thread": False})
 
 
-@app.on_event("startup")
-async def on_startup():
-    SQLModel.metadata.create_all(engine)
-    pass
+@event.listens_for(engine, "connect")
+def _tune_sqlite(dbapi_conn, _record):
+    """
+    Apply tuning PRAGMAs as each pooled connection opens: WAL (persistent,
+    lets readers proceed alongside a writer) plus the per-connection
+    settings that drop the per-commit fsync the cache upserts would pay.
+    """
+    cursor = dbapi_conn.cursor()
+    for pragma in ("journal_mode=WAL", "synchronous=NORMAL",
+                   "temp_store=MEMORY", "mmap_size=268435456"):
+        cursor.execute(f"PRAGMA {pragma}")
+    cursor.close()
 
+log = logging.getLogger(__name__)
 
-@app.get("/get_local_ip", response_model=LocalIPResponse)
-def get_local_ip(target_ip: Optional[str] = Query(
-    None,
-    description=
-    "Optional. If provided, returns the local IP/interface that would be used to reach this target IP (useful for multi-homed systems). If not provided, defaults to 8.8.8.8 (internet route)."
-)):
+# Ping command template, computed once per process: one packet with a
+# 2-second timeout (Windows uses -n/-w in ms, everything else -c/-W).
+_PING_CMD = (("ping", "-n", "1", "-w", "2000")
+             if sys.platform.startswith("win") else
+             ("ping", "-c", "1", "-W", "2"))
+
+# Patterns for parsing ipconfig.exe / ip(8) output, compiled once.
+_IPCONFIG_IPV4_RE = re.compile(r"IPv4 Address[. ]*: ([0-9.]+)")
+_IP_ROUTE_DEV_RE = re.compile(r'dev\s+(\S+)')
+_IP_ADDR_INET_RE = re.compile(r'inet\s+([0-9.]+)')
+
+# The host IP rarely changes; cache the detected value briefly so repeated
+# UI probes don't shell out to ipconfig.exe / ip every time.
+_HOST_IP_TTL = 60
+_host_ip_cache = {'ts': 0.0, 'ip': None}
+
+# Object-name listings only change when a device is reprogrammed; cache
+# recently served pages so consecutive UI polls skip the slow BACnet read.
+_object_list_cache = TTLCache(maxsize=256, ttl=30)
+
+# Frontends tend to re-request the subnet they just scanned; keep the
+# serialized response bytes briefly so repeats skip the Who-Is sweep and
+# the re-encode entirely.
+_scan_response_cache = TTLCache(maxsize=64, ttl=10)
+
+# Fields kept from an I-Am response when building scan results.
+_IAM_FIELDS = ("pduSource", "deviceIdentifier", "maxAPDULengthAccepted",
+               "segmentationSupported", "vendorID")
+
+# Validates a whole device list in one crossing into pydantic-core instead
+# of running the Python-level BACnetDevice constructor per device.
+_DEVICE_LIST = TypeAdapter(List[BACnetDevice])
+
+
+def _device_from_iam(dev):
     """
-    Returns the local IP, subnet mask, and CIDR notation for the interface used to reach the target IP.
-    If no target_ip is provided, defaults to 8.8.8.8 to determine the main outbound interface.
+    Build a device-row dict from the minimal I-Am response fields,
+    normalizing deviceIdentifier/device_instance and extracting the IP
+    from pduSource. Rows are validated in bulk via _DEVICE_LIST.
+    """
+    dev_out = {k: dev[k] for k in _IAM_FIELDS if k in dev}
+    did = dev_out.get("deviceIdentifier")
+    if isinstance(did, (list, tuple)) and len(did) == 2:
+        dev_out["device_instance"] = did[1]
+        dev_out["deviceIdentifier"] = f"{did[0]},{did[1]}"
+    pdu_source = dev.get("pduSource")
+    if isinstance(pdu_source, str):
+        # If pduSource is an IP:port string, keep just the IP
+        dev_out["address"] = pdu_source.split(":")[0]
+    else:
+        dev_out["address"] = None
+    return dev_out
+
+
+# Cap on concurrent outbound IPC sends: a burst of requests queues here
+# instead of pinning one message/Future per request on the proxy.
+_SEND_CONCURRENCY = 64
+
+
+@dataclass
+class ProxyState:
+    """
+    All mutable BACnet proxy state, held as one object at app.state.proxy.
+    A plain attribute read here avoids Starlette's State.__getattr__ dict
+    lookup plus the raise/catch that hasattr() checks paid per request.
+    """
+    manager: Optional[AsyncioBACnetManager] = None
+    task: Optional[asyncio.Task] = None
+    local_addr: Optional[str] = None
+    socket_params: Any = None
+    ready: asyncio.Event = field(default_factory=asyncio.Event)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    send_sem: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(_SEND_CONCURRENCY))
+
+
+@asynccontextmanager
+async def lifespan(app):
+    app.state.proxy = ProxyState()
+    # Schema creation is synchronous; run it on a worker thread so startup
+    # isn't serialized behind SQLite I/O.
+    await asyncio.to_thread(SQLModel.metadata.create_all, engine)
+    # Build the OpenAPI schema now: generating it lazily re-walks every
+    # model annotation on the first /docs or /openapi.json hit.
+    app.openapi_schema = await asyncio.to_thread(
+        get_openapi, title=app.title, version=app.version, routes=app.routes)
+    yield
+    if app.state.proxy.task:
+        app.state.proxy.task.cancel()
+
+
+class RawJSONResponse(JSONResponse):
+    """JSON response that passes pre-serialized bytes through untouched."""
+
+    def render(self, content) -> bytes:
+        if isinstance(content, (bytes, bytearray)):
+            return bytes(content)
+        return orjson.dumps(content)
+
+
+# TODO handle who is AND just one device.
+# Default every route to orjson rendering so even plain dict returns skip
+# stdlib json.dumps.
+app = FastAPI(lifespan=lifespan, default_response_class=RawJSONResponse)
+
+
+# How long requests wait for the proxy peer to register before giving up.
+PROXY_READY_TIMEOUT = 5.0
+
+
+def _manager_task_done(task):
+    """
+    Done-callback for the BACnet manager task. If the manager exits for any
+    reason, mark the proxy unavailable so requests fail fast with the usual
+    proxy-not-registered error instead of blocking until client timeout.
+    """
+    # A superseded manager may finish unwinding after its replacement has
+    # already registered; only the current task may clear the shared state.
+    if task is not app.state.proxy.task:
+        return
+    app.state.proxy.ready.clear()
+    app.state.proxy.socket_params = None
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc:
+        log.error("BACnet manager task died: %s", exc)
+
+
+async def _wait_proxy_registered(manager, local_addr):
+    """
+    Poll the proxy manager until the peer registers, then publish its
+    socket_params and set the proxy_ready event for waiting requests.
+    """
+    while True:
+        proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
+        peer = manager.ppm.peers.get(proxy_id)
+        if peer and peer.socket_params:
+            app.state.proxy.socket_params = peer.socket_params
+            app.state.proxy.ready.set()
+            return peer
+        await asyncio.sleep(0.05)
+
+
+async def _get_ready_socket_params():
+    """
+    Wait (bounded) for the proxy to be ready and return its socket_params.
+    Raises asyncio.TimeoutError if the proxy never registers.
+    """
+    await asyncio.wait_for(app.state.proxy.ready.wait(),
+                           timeout=PROXY_READY_TIMEOUT)
+    return app.state.proxy.socket_params
+
+
+def fast_json(model) -> RawJSONResponse:
+    """
+    Serialize a response model straight to bytes in pydantic-core and ship
+    them as-is, skipping FastAPI's jsonable_encoder pass and the response
+    re-validation that a response_model declaration would trigger.
+    """
+    return RawJSONResponse(model.model_dump_json(exclude_none=True).encode())
+
+
+@lru_cache(maxsize=256)
+def _encode_payload(items: tuple) -> bytes:
+    """
+    Serialize a payload given as a tuple of (key, value) pairs. UI polling
+    and repeated scans re-send identical payloads; caching the encoded
+    bytes skips the dict build and dumps on every duplicate.
+    """
+    return orjson.dumps(dict(items))
+
+
+# A hung proxy must not hold a worker connection forever: the send itself
+# and the reply future each get a deadline.
+SEND_TIMEOUT = 10.0
+REPLY_TIMEOUT = 15.0
+
+
+class ProxyReplyTimeoutError(asyncio.TimeoutError):
+    """
+    A registered proxy accepted the request but the send or its reply
+    missed the deadline. Distinct from the plain asyncio.TimeoutError the
+    ready-wait raises when the proxy never registered, so handlers can
+    report "device is slow" and "proxy is missing" differently.
+    """
+
+
+async def _proxy_rpc_raw(method_name: str, payload,
+                         reply_timeout: float = REPLY_TIMEOUT) -> bytes:
+    """
+    Send a request to the registered proxy peer and return the raw reply
+    bytes. ``payload`` may be a dict or pre-encoded bytes. Raises
+    asyncio.TimeoutError if the proxy never registers, and
+    ProxyReplyTimeoutError if the send stalls past SEND_TIMEOUT or no
+    reply arrives within ``reply_timeout``.
+    """
+    manager = app.state.proxy.manager
+    socket_params = await _get_ready_socket_params()
+    if not isinstance(payload, bytes):
+        payload = orjson.dumps(payload)
+    try:
+        async with app.state.proxy.send_sem:
+            result = await asyncio.wait_for(
+                manager.ppm.send(
+                    socket_params,
+                    ProtocolProxyMessage(method_name=method_name,
+                                         payload=payload,
+                                         response_expected=True)),
+                timeout=SEND_TIMEOUT)
+        if asyncio.isfuture(result):
+            result = await asyncio.wait_for(result, timeout=reply_timeout)
+    except asyncio.TimeoutError:
+        raise ProxyReplyTimeoutError(
+            f"{method_name} reply missed its deadline")
+    return result
+
+
+# In-flight request coalescing: concurrent identical reads share a single
+# BACnet transaction instead of each paying a ~120ms round-trip.
+_inflight_rpcs = {}
+
+
+async def _coalesced_rpc(ident: str, method_name: str, payload: dict,
+                         reply_timeout: float = REPLY_TIMEOUT):
+    """
+    Like _proxy_rpc, but concurrent calls with the same ident await the same
+    outstanding transaction and all receive its decoded result.
+    """
+    task = _inflight_rpcs.get(ident)
+    if task is None:
+        task = asyncio.ensure_future(
+            _proxy_rpc(method_name, payload, reply_timeout=reply_timeout))
+        _inflight_rpcs[ident] = task
+        task.add_done_callback(lambda _: _inflight_rpcs.pop(ident, None))
+    # Shield so one caller cancelling doesn't kill the shared transaction.
+    return await asyncio.shield(task)
+
+
+# Cap concurrent sub-scan sends so a wide fan-out doesn't become a UDP storm.
+_scan_fanout_sem = asyncio.Semaphore(32)
+
+# Networks wider than this prefix are split into chunks of this size and
+# scanned concurrently; Who-Is is IO-bound, so wall time drops with fan-out.
+_SCAN_CHUNK_PREFIX = 24
+
+
+# Sweeping a /24 with Who-Is takes far longer than a single read; give
+# scan chunks their own reply deadline.
+_SCAN_CHUNK_TIMEOUT = 120.0
+
+
+async def _scan_chunk(network_str: str) -> bytes:
+    async with _scan_fanout_sem:
+        return await _proxy_rpc_raw(
+            "SCAN_SUBNET", _encode_payload((("network_str", network_str),)),
+            reply_timeout=_SCAN_CHUNK_TIMEOUT)
+
+
+def _scan_chunk_cidrs(net) -> list:
+    """
+    Split a network into CIDR strings of at most _SCAN_CHUNK_PREFIX size.
+    Chunk CIDRs are derived with integer math rather than materializing an
+    IPv4Network object per subnet.
+    """
+    if net.version == 4 and net.prefixlen < _SCAN_CHUNK_PREFIX:
+        base = int(net.network_address)
+        step = 1 << (32 - _SCAN_CHUNK_PREFIX)
+        return [
+            f"{socket.inet_ntoa(struct.pack('!I', base + i * step))}/{_SCAN_CHUNK_PREFIX}"
+            for i in range(net.num_addresses // step)
+        ]
+    return [str(net)]
+
+
+async def _proxy_rpc(method_name: str, payload: dict,
+                     reply_timeout: float = REPLY_TIMEOUT):
+    """
+    Send a request to the registered proxy peer and return the decoded JSON
+    reply. Raises asyncio.TimeoutError if the proxy never registers,
+    ProxyReplyTimeoutError if the reply misses its deadline, and
+    json.JSONDecodeError if the reply is not valid JSON.
+    """
+    result = await _proxy_rpc_raw(method_name, payload,
+                                  reply_timeout=reply_timeout)
+    return orjson.loads(result)
+
+
+def _probe_outbound_ip(target: str) -> str:
+    """
+    Return the local IP the kernel would route through to reach target.
+    Blocking (UDP connect): call from a thread, not the event loop.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect((target, 80))
+        return s.getsockname()[0]
+    finally:
+        s.close()
+
+
+def _local_ip_info(target_ip: Optional[str]) -> LocalIPResponse:
+    """
+    Blocking half of get_local_ip: probe the outbound interface and look
+    up its netmask. Runs on a worker thread.
     """
     try:
         # Use 8.8.8.8 as the default target if not provided
         effective_target = target_ip if target_ip else "8.8.8.8"
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        s.connect((effective_target, 80))
-        local_ip = s.getsockname()[0]
-        s.close()
+        local_ip = _probe_outbound_ip(effective_target)
         # Now, get subnet mask and CIDR
-        try:
-            import netifaces
-            iface_name = None
-            subnet_mask = None
-            for iface in netifaces.interfaces():
-                addrs = netifaces.ifaddresses(iface)
-                if netifaces.AF_INET in addrs:
-                    for addr in addrs[netifaces.AF_INET]:
-                        if addr.get('addr') == local_ip:
-                            iface_name = iface
-                            subnet_mask = addr.get('netmask')
-                            break
-                if iface_name:
-                    break
-            if iface_name and subnet_mask:
-                import ipaddress
-                net = ipaddress.IPv4Network(f"{local_ip}/{subnet_mask}",
-                                            strict=False)
-                cidr = f"{local_ip}/{net.prefixlen}"
-                return LocalIPResponse(
-                    local_ip=local_ip,
-                    subnet_mask=subnet_mask,
-                    cidr=cidr
-                )
-            else:
-                return LocalIPResponse(
-                    local_ip=local_ip,
-                    error="Could not determine subnet mask for this interface."
-                )
-        except ImportError:
-            return LocalIPResponse(
+        if netifaces is None:
+            return LocalIPResponse.model_construct(
                 local_ip=local_ip,
                 error="netifaces package not installed. Install with 'pip install netifaces' to get subnet mask and CIDR."
             )
+        iface_name, subnet_mask = _iface_map().get(local_ip, (None, None))
+        if iface_name and subnet_mask:
+            net = ipaddress.IPv4Network(f"{local_ip}/{subnet_mask}",
+                                        strict=False)
+            cidr = f"{local_ip}/{net.prefixlen}"
+            return LocalIPResponse.model_construct(
+                local_ip=local_ip,
+                subnet_mask=subnet_mask,
+                cidr=cidr
+            )
+        else:
+            return LocalIPResponse.model_construct(
+                local_ip=local_ip,
+                error="Could not determine subnet mask for this interface."
+            )
     except Exception:
-        return LocalIPResponse(
+        return LocalIPResponse.model_construct(
             local_ip="127.0.0.1",
             error="Could not determine local IP."
         )
 
 
-@app.post("/start_proxy", response_model=ProxyResponse)
+@app.get("/get_local_ip", responses={200: {"model": LocalIPResponse}})
+async def get_local_ip(target_ip: Optional[str] = Query(
+    None,
+    description=
+    "Optional. If provided, returns the local IP/interface that would be used to reach this target IP (useful for multi-homed systems). If not provided, defaults to 8.8.8.8 (internet route)."
+)):
+    """
+    Returns the local IP, subnet mask, and CIDR notation for the interface used to reach the target IP.
+    If no target_ip is provided, defaults to 8.8.8.8 to determine the main outbound interface.
+    The socket probe and netifaces lookup block, so they run on a thread.
+    """
+    return fast_json(await asyncio.to_thread(_local_ip_info, target_ip))
+
+
+@app.post("/start_proxy", responses={200: {"model": ProxyResponse}})
 async def start_proxy(local_device_address: Optional[str] = Form(None)):
     """
     Start the BACnet proxy with the given local device address (IP), or auto-detect if not provided.
@@ -100,52 +457,58 @@ async def start_proxy(local_device_address: Optional[str] = Form(None)):
         # If no address provided, auto-detect using get_local_ip logic
         if not local_device_address:
             try:
-                s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-                s.connect(("8.8.8.8", 80))
-                local_device_address = s.getsockname()[0]
-                s.close()
+                local_device_address = await asyncio.to_thread(
+                    _probe_outbound_ip, "8.8.8.8")
             except Exception:
-                return ProxyResponse(
+                return fast_json(ProxyResponse.model_construct(
                     status="error",
                     error="Could not auto-detect local IP address. Please specify manually."
-                )
-        # If a proxy is already running, stop it first
-        if hasattr(app.state,
-                   "bacnet_manager_task") and app.state.bacnet_manager_task:
-            app.state.bacnet_manager_task.cancel()
-            await asyncio.sleep(0.5)
-        app.state.bacnet_manager = AsyncioBACnetManager(local_device_address)
-        app.state.bacnet_manager_task = asyncio.create_task(
-            app.state.bacnet_manager.run())
-        app.state.bacnet_proxy_local_address = local_device_address  # Save the address for later use
-        # Wait a bit for registration
-        await asyncio.sleep(3)
-        # Check registration
-        manager = app.state.bacnet_manager
-        proxy_id = manager.ppm.get_proxy_id((local_device_address, 0))
-        peer = manager.ppm.peers.get(proxy_id)
-        if not peer or not peer.socket_params:
-            return ProxyResponse(
-                status="error",
-                error="Proxy not registered or missing socket_params."
-            )
-        return ProxyResponse(status="done", address=local_device_address)
+                ))
+        # Serialize proxy lifecycle changes: concurrent start/stop calls
+        # could otherwise double-create managers mid-teardown.
+        proxy = app.state.proxy
+        async with proxy.lock:
+            # If a proxy is already running, stop it first
+            if proxy.task:
+                proxy.task.cancel()
+                await asyncio.sleep(0.5)
+            proxy.ready.clear()
+            proxy.socket_params = None
+            _object_list_cache.clear()
+            _scan_response_cache.clear()
+            proxy.manager = AsyncioBACnetManager(local_device_address)
+            proxy.task = asyncio.create_task(proxy.manager.run())
+            proxy.task.add_done_callback(_manager_task_done)
+            proxy.local_addr = local_device_address  # Save the address for later use
+            # Wait for the proxy to actually register instead of a fixed sleep
+            try:
+                await asyncio.wait_for(
+                    _wait_proxy_registered(proxy.manager,
+                                           local_device_address),
+                    timeout=PROXY_READY_TIMEOUT)
+            except asyncio.TimeoutError:
+                return fast_json(ProxyResponse.model_construct(
+                    status="error",
+                    error="Proxy not registered or missing socket_params."
+                ))
+            return fast_json(ProxyResponse.model_construct(status="done", address=local_device_address))
     except Exception as e:
-        return ProxyResponse(status="error", error=str(e))
+        return fast_json(ProxyResponse.model_construct(status="error", error=str(e)))
+
 
+def _cache_host_ip(ip: str) -> RawJSONResponse:
+    """Remember the detected host IP for a short TTL and wrap it."""
+    _host_ip_cache['ts'] = time.monotonic()
+    _host_ip_cache['ip'] = ip
+    return fast_json(IPAddress(address=ip))
 
-@app.get("/get_host_ip", response_model=IPAddress)
-def get_host_ip():
+
+def _detect_host_ip() -> RawJSONResponse:
     """
-    Returns the first non-loopback IPv4 address. Works on both WSL and native Linux systems.
-    For WSL: attempts to get Windows host IP via ipconfig.exe
-    For native Linux: returns the primary network interface IP
+    Blocking half of get_host_ip: shells out to ipconfig.exe / ip /
+    hostname to find the first usable IPv4 address. Runs on a worker
+    thread so the subprocess waits don't stall the event loop.
     """
-    import subprocess
-    import re
-    import os
-    import platform
-    
     # First, try WSL method (ipconfig.exe)
     try:
         # Check if we're in WSL by looking for ipconfig.exe availability
@@ -155,13 +518,13 @@ def get_host_ip():
         output = subprocess.check_output(["ipconfig.exe"],
                                          encoding="utf-8",
                                          errors="ignore")
-        ips = re.findall(r"IPv4 Address[. ]*: ([0-9.]+)", output)
+        ips = _IPCONFIG_IPV4_RE.findall(output)
         for ip in ips:
             if not (ip.startswith("127.") or ip.startswith("172.")
                     or ip.startswith("192.168.56.")):
-                return IPAddress(address=ip)
+                return _cache_host_ip(ip)
         if ips:
-            return IPAddress(address=ips[0])
+            return _cache_host_ip(ips[0])
     except (subprocess.CalledProcessError, FileNotFoundError):
         # Not in WSL or ipconfig.exe not available, try Linux methods
         pass
@@ -176,8 +539,7 @@ def get_host_ip():
                 encoding="utf-8"
             )
             # Extract interface name from default route
-            import re
-            match = re.search(r'dev\s+(\S+)', route_output)
+            match = _IP_ROUTE_DEV_RE.search(route_output)
             if match:
                 interface = match.group(1)
                 # Get IP of that interface
@@ -185,11 +547,11 @@ def get_host_ip():
                     ["ip", "addr", "show", interface],
                     encoding="utf-8"
                 )
-                ip_match = re.search(r'inet\s+([0-9.]+)', addr_output)
+                ip_match = _IP_ADDR_INET_RE.search(addr_output)
                 if ip_match:
                     ip = ip_match.group(1)
                     if not ip.startswith("127."):
-                        return IPAddress(address=ip)
+                        return _cache_host_ip(ip)
         except (subprocess.CalledProcessError, AttributeError):
             pass
 
@@ -201,9 +563,9 @@ def get_host_ip():
             for ip in ips:
                 if not (ip.startswith("127.") or ip.startswith("172.")
                         or ip.startswith("192.168.56.")):
-                    return IPAddress(address=ip)
+                    return _cache_host_ip(ip)
             if ips:
-                return IPAddress(address=ips[0])
+                return _cache_host_ip(ips[0])
         except subprocess.CalledProcessError:
             pass
         
@@ -219,11 +581,11 @@ def get_host_ip():
                             ["ip", "addr", "show", interface],
                             encoding="utf-8"
                         )
-                        ip_match = re.search(r'inet\s+([0-9.]+)', addr_output)
+                        ip_match = _IP_ADDR_INET_RE.search(addr_output)
                         if ip_match:
                             ip = ip_match.group(1)
                             if not ip.startswith("127."):
-                                return IPAddress(address=ip)
+                                return _cache_host_ip(ip)
         except (FileNotFoundError, subprocess.CalledProcessError):
             pass
         
@@ -233,133 +595,192 @@ def get_host_ip():
         raise HTTPException(status_code=500, detail=f"Could not determine host IPv4 address: {str(e)}")
 
 
-@app.post("/bacnet/scan_subnet", response_model=ScanResponse)
+@app.get("/get_host_ip", responses={200: {"model": IPAddress}})
+async def get_host_ip():
+    """
+    Returns the first non-loopback IPv4 address. Works on both WSL and native Linux systems.
+    For WSL: attempts to get Windows host IP via ipconfig.exe
+    For native Linux: returns the primary network interface IP
+    """
+    now = time.monotonic()
+    if _host_ip_cache['ip'] and now - _host_ip_cache['ts'] < _HOST_IP_TTL:
+        return fast_json(IPAddress(address=_host_ip_cache['ip']))
+    return await asyncio.to_thread(_detect_host_ip)
+
+
+@app.post("/bacnet/scan_subnet", responses={200: {"model": ScanResponse}})
 async def scan_subnet(subnet: str = Form(...)):
     """
     Scan a subnet (CIDR notation, e.g. 192.168.1.0/24) for BACnet devices using brute-force Who-Is.
     Ensures each device result includes 'device_instance', 'object_name', 'deviceIdentifier', and extra BACnet info.
     """
-    manager = app.state.bacnet_manager
-    local_addr = app.state.bacnet_proxy_local_address
-    proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
-    peer = manager.ppm.peers.get(proxy_id)
-    if not peer or not peer.socket_params:
-        # Calculate number of IPs in the subnet for error case
-        import ipaddress
-        try:
-            net = ipaddress.ip_network(subnet, strict=False)
-            ips_scanned = net.num_addresses - 2 if net.num_addresses > 2 else net.num_addresses
-        except Exception:
-            ips_scanned = 0
-        return ScanResponse(
-            status="error",
-            error="Proxy not registered or missing, cannot scan.",
-            ips_scanned=ips_scanned
-        )
-    from protocol_proxy.ipc import ProtocolProxyMessage
-    import json
-    payload = {"network_str": subnet}
+    cached = _scan_response_cache.get(subnet)
+    if cached is not None:
+        return RawJSONResponse(cached)
     # Calculate number of IPs in the subnet
-    import ipaddress
     try:
         net = ipaddress.ip_network(subnet, strict=False)
         ips_scanned = net.num_addresses - 2 if net.num_addresses > 2 else net.num_addresses
     except Exception:
+        net = None
         ips_scanned = 0
-    result = await manager.ppm.send(
-        peer.socket_params,
-        ProtocolProxyMessage(method_name="SCAN_SUBNET",
-                             payload=json.dumps(payload).encode('utf8'),
-                             response_expected=True))
-    if asyncio.isfuture(result):
-        result = await result
-    try:
-        value = json.loads(result.decode('utf8'))
-
+    # Split wide networks into chunks the proxy can work concurrently;
+    # Who-Is is IO-bound UDP, so fan-out cuts wall time roughly linearly.
+    chunks = _scan_chunk_cidrs(net) if net is not None else [subnet]
+    results = await asyncio.gather(*(_scan_chunk(c) for c in chunks),
+                                   return_exceptions=True)
+    devices_raw = []
+    errors = []
+    for result in results:
+        if isinstance(result, ProxyReplyTimeoutError):
+            errors.append("Scan chunk timed out waiting for the proxy reply.")
+            continue
+        if isinstance(result, asyncio.TimeoutError):
+            errors.append("Proxy not registered or missing, cannot scan.")
+            continue
+        if isinstance(result, BaseException):
+            errors.append(f"Error processing scan_subnet response: {result}")
+            continue
+        try:
+            value = orjson.loads(result)
+        except (orjson.JSONDecodeError, TypeError) as e:
+            result_str = result.decode('utf8', errors='replace') if isinstance(result, bytes) else str(result)
+            if not result_str or result_str.strip() == 'FOO':
+                errors.append("Scan operation timed out - no response received from BACnet proxy")
+            else:
+                errors.append(f"Error decoding scan_subnet response: {e}. Raw response: {result_str[:200]}")
+            continue
         # Check if this is a timeout error response
-        if isinstance(value, dict) and value.get(
-                'status') == 'error' and 'timed out' in value.get('error', ''):
-            return ScanResponse(
-                status="error",
-                error=f"Scan operation timed out: {value.get('error', 'Unknown timeout error')}",
-                ips_scanned=ips_scanned
-            )
-
-        # Only return the minimal Who-Is/I-Am response data for each device
-        from .models import BACnetDevice
-        processed = []
-        for dev in value:
-            dev_out = {}
-            # Only keep the fields from the I-Am response
-            for k in ["pduSource", "deviceIdentifier", "maxAPDULengthAccepted", "segmentationSupported", "vendorID"]:
-                if k in dev:
-                    dev_out[k] = dev[k]
-            # Fix deviceIdentifier and device_instance for BACnetDevice model
-            did = dev_out.get("deviceIdentifier")
-            if isinstance(did, (list, tuple)) and len(did) == 2:
-                dev_out["device_instance"] = did[1]
-                dev_out["deviceIdentifier"] = f"{did[0]},{did[1]}"
-            # Extract IP address from pduSource (if present)
-            pdu_source = dev.get("pduSource")
-            if isinstance(pdu_source, str):
-                # If pduSource is an IP:port string, extract just the IP
-                if ":" in pdu_source:
-                    dev_out["address"] = pdu_source.split(":")[0]
-                else:
-                    dev_out["address"] = pdu_source
+        if isinstance(value, dict) and value.get('status') == 'error':
+            if 'timed out' in value.get('error', ''):
+                errors.append(f"Scan operation timed out: {value.get('error', 'Unknown timeout error')}")
             else:
-                dev_out["address"] = None
-            processed.append(BACnetDevice(**dev_out))
-        return ScanResponse(status="done", devices=processed, ips_scanned=ips_scanned)
-    except json.JSONDecodeError as e:
-        result_str = result.decode('utf8', errors='replace') if isinstance(result, bytes) else str(result)
-        if not result_str or result_str.strip() == 'FOO':
-            return ScanResponse(
-                status="error",
-                error="Scan operation timed out - no response received from BACnet proxy",
-                ips_scanned=ips_scanned
-            )
-        return ScanResponse(
+                errors.append(value.get('error', 'Unknown error'))
+            continue
+        devices_raw.extend(value)
+    if errors and not devices_raw:
+        return fast_json(ScanResponse.model_construct(
             status="error",
-            error=f"Error decoding scan_ip_range response: {e}. Raw response: {result_str[:200]}",
+            error=errors[0],
             ips_scanned=ips_scanned
-        )
+        ))
+    # Only return the minimal Who-Is/I-Am response data for each device
+    try:
+        processed = _DEVICE_LIST.validate_python(
+            [_device_from_iam(dev) for dev in devices_raw])
     except Exception as e:
-        return ScanResponse(
+        return fast_json(ScanResponse.model_construct(
             status="error",
-            error=f"Error processing scan_ip_range response: {e}",
+            error=f"Error processing scan_subnet response: {e}",
             ips_scanned=ips_scanned
-        )
+        ))
+    # Surface partial failures: a mostly-failed scan of a big subnet should
+    # not look identical to a clean scan of an empty one.
+    error = None
+    if errors:
+        error = (f"{len(errors)} of {len(chunks)} scan chunks failed; "
+                 f"first error: {errors[0]}")
+    body = ScanResponse.model_construct(
+        status="done", devices=processed, error=error,
+        ips_scanned=ips_scanned).model_dump_json(exclude_none=True).encode()
+    if not errors:
+        # Only replay complete scans; a partial result should be retried.
+        _scan_response_cache[subnet] = body
+    return RawJSONResponse(body)
+
+
+@app.post("/bacnet/scan_subnet_stream")
+async def scan_subnet_stream(subnet: str = Form(...)):
+    """
+    Scan a subnet like /bacnet/scan_subnet, but stream results back as
+    NDJSON: one device per line, emitted as each sub-scan completes. The
+    client can render devices immediately and memory stays bounded by the
+    chunk size instead of the whole device list.
+    """
+    try:
+        net = ipaddress.ip_network(subnet, strict=False)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid subnet: {e}")
+    chunks = _scan_chunk_cidrs(net)
+
+    async def gen():
+        tasks = [asyncio.ensure_future(_scan_chunk(c)) for c in chunks]
+        try:
+            for fut in asyncio.as_completed(tasks):
+                try:
+                    value = orjson.loads(await fut)
+                except Exception as e:
+                    yield orjson.dumps({"status": "error",
+                                        "error": str(e)}) + b"\n"
+                    continue
+                if isinstance(value, dict) and value.get('status') == 'error':
+                    yield orjson.dumps(value) + b"\n"
+                    continue
+                for dev in value:
+                    yield orjson.dumps(_device_from_iam(dev)) + b"\n"
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+
+def _jsonable_passthrough(obj):
+    return obj
+
+
+def _jsonable_bytes(obj):
+    return bytes(obj).decode('utf-8', errors='replace')
+
+
+def _jsonable_dict(obj):
+    return {make_jsonable(k): make_jsonable(v) for k, v in obj.items()}
+
+
+def _jsonable_seq(obj):
+    return [make_jsonable(x) for x in obj]
+
+
+# Exact-type dispatch for make_jsonable: one dict lookup per node instead of
+# walking an isinstance ladder. Subclasses fall through to the slow path.
+_MAKE_JSONABLE_DISPATCH = {
+    type(None): _jsonable_passthrough,
+    str: _jsonable_passthrough,
+    int: _jsonable_passthrough,
+    float: _jsonable_passthrough,
+    bool: _jsonable_passthrough,
+    bytes: _jsonable_bytes,
+    bytearray: _jsonable_bytes,
+    dict: _jsonable_dict,
+    list: _jsonable_seq,
+    tuple: _jsonable_seq,
+    set: _jsonable_seq,
+    ipaddress.IPv4Address: str,
+    ipaddress.IPv6Address: str,
+}
 
 
 def make_jsonable(obj):
     """
     Recursively convert BACnet objects, enums, and tuples to JSON-serializable types.
     """
-    import ipaddress
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, bytes):
-        return obj.decode('utf-8', errors='replace')
-    if isinstance(obj, bytearray):
-        return bytes(obj).decode('utf-8', errors='replace')
+    handler = _MAKE_JSONABLE_DISPATCH.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    # Slow path: subclasses of the container/scalar types, enums, and
+    # everything else BACnet hands back.
     if isinstance(obj, dict):
-        return {make_jsonable(k): make_jsonable(v) for k, v in obj.items()}
+        return _jsonable_dict(obj)
     if isinstance(obj, (list, set, tuple)):
-        return [make_jsonable(x) for x in obj]
+        return _jsonable_seq(obj)
+    if isinstance(obj, (bytes, bytearray)):
+        return _jsonable_bytes(obj)
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
     if hasattr(obj, 'name') and hasattr(obj, 'value'):
         # Likely an enum
         return str(obj.name)
-    if hasattr(
-            obj,
-            '__class__') and obj.__class__.__name__.startswith('ObjectType'):
-        return str(obj)
-    if isinstance(obj, ipaddress.IPv4Address) or isinstance(
-            obj, ipaddress.IPv6Address):
-        return str(obj)
-    # Fallback to string
+    # Fallback to string (covers ObjectType and IP address subclasses)
     return str(obj)
 
 
@@ -378,31 +799,32 @@ async def write_property(device_address: str,
     """
     Write a value to a specific property of a device point.
     """
-    ppm = ProtocolProxyManager.get_manager(BACnetProxy)
+    try:
+        socket_params = await _get_ready_socket_params()
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=503,
+            detail="Proxy not registered or missing socket_params.")
     message = ProtocolProxyMessage(method_name="WRITE_PROPERTY",
-                                   payload=json.dumps({
-                                       "device_address":
-                                       device_address,
-                                       "object_identifier":
-                                       object_identifier,
-                                       "property_identifier":
-                                       property_identifier,
-                                       "value":
-                                       value,
-                                       "priority":
-                                       priority,
-                                       "property_array_index":
-                                       property_array_index
-                                   }).encode('utf8'))
-
-    remote_params = ppm.peers.socket_params
-    send_result = await ppm.send(remote_params, message)
-    print("Sent WRITE_PROPERTY message")
+                                   payload=orjson.dumps({
+                                       "device_address": device_address,
+                                       "object_identifier": object_identifier,
+                                       "property_identifier": property_identifier,
+                                       "value": value,
+                                       "priority": priority,
+                                       "property_array_index": property_array_index
+                                   }))
+
+    async with app.state.proxy.send_sem:
+        send_result = await asyncio.wait_for(
+            app.state.proxy.manager.ppm.send(socket_params, message),
+            timeout=SEND_TIMEOUT)
+    log.debug("Sent WRITE_PROPERTY message")
 
     return send_result
 
 
-@app.post("/read_property", response_model=PropertyReadResponse)
+@app.post("/read_property", responses={200: {"model": PropertyReadResponse}})
 async def read_property(device_address: str = Form(...),
                         object_identifier: str = Form(...),
                         property_identifier: str = Form(...),
@@ -410,221 +832,307 @@ async def read_property(device_address: str = Form(...),
     """
     Perform a BACnet property read and return the result directly (waits for completion).
     """
-    print(
-        "[read_property] Using global AsyncioBACnetManager from app.state...")
+    payload = {
+        'device_address': device_address,
+        'object_identifier': object_identifier,
+        'property_identifier': property_identifier
+    }
+    if property_array_index is not None:
+        payload['property_array_index'] = property_array_index
+    log.debug("[read_property] Sending ProtocolProxyMessage: %s", payload)
+    ident = (f"rp:{device_address}:{object_identifier}:"
+             f"{property_identifier}:{property_array_index}")
     try:
-        manager = app.state.bacnet_manager
-        local_addr = app.state.bacnet_proxy_local_address
-        proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
-        peer = manager.ppm.peers.get(proxy_id)
-        if not peer or not peer.socket_params:
-            print(
-                "[read_property] Proxy not registered or missing socket_params!"
-            )
-            return PropertyReadResponse(
-                status="error",
-                error="Proxy not registered or missing socket_params, cannot send request."
-            )
-        payload = {
-            'device_address': device_address,
-            'object_identifier': object_identifier,
-            'property_identifier': property_identifier
-        }
-        if property_array_index is not None:
-            payload['property_array_index'] = property_array_index
-        print(f"[read_property] Sending ProtocolProxyMessage: {payload}")
-
-        result = await manager.ppm.send(
-            peer.socket_params,
-            ProtocolProxyMessage(method_name='READ_PROPERTY',
-                                 payload=json.dumps(payload).encode('utf8'),
-                                 response_expected=True))
-        print("[read_property] Got result from send()")
-        if asyncio.isfuture(result):
-            print("[read_property] Result is a Future, awaiting...")
-            result = await result
-        print(f"[read_property] Raw result: {result}")
-        try:
-            value = json.loads(result.decode('utf8'))
-            print(f"[read_property] Decoded value: {value}")
-            # --- Normalization logic for response ---
-            # If property is 'object-name', return {"object_name": ...}
-            # If value is {"_value": ...}, return just the value
-            normalized = value
-            if property_identifier.lower().replace("-", "_") == "object_name":
-                # Accept both 'object-name' and 'object_name'
-                if isinstance(value, dict):
-                    # Try to extract from common keys
-                    for k in ["object-name", "object_name", "_value", "value"]:
-                        if k in value:
-                            normalized = {"object_name": value[k]}
-                            break
-                    else:
-                        normalized = {"object_name": value}
-                else:
-                    normalized = {"object_name": value}
-            elif isinstance(value, dict) and set(value.keys()) == {"_value"}:
-                normalized = value["_value"]
-            return PropertyReadResponse(status="done", result=normalized)
-        except Exception as e:
-            print(f"[read_property] Error decoding BACnet response: {e}")
-            return PropertyReadResponse(
-                status="error",
-                error=f"Error decoding BACnet response: {e}"
-            )
+        value = await _coalesced_rpc(ident, 'READ_PROPERTY', payload)
+    except ProxyReplyTimeoutError:
+        return fast_json(PropertyReadResponse.model_construct(
+            status="error",
+            error="read_property timed out waiting for the device."
+        ))
+    except asyncio.TimeoutError:
+        log.debug(
+            "[read_property] Proxy not registered or missing socket_params!")
+        return fast_json(PropertyReadResponse.model_construct(
+            status="error",
+            error="Proxy not registered or missing socket_params, cannot send request."
+        ))
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        log.debug("[read_property] Error decoding BACnet response: %s", e)
+        return fast_json(PropertyReadResponse.model_construct(
+            status="error",
+            error=f"Error decoding BACnet response: {e}"
+        ))
     except Exception as e:
-        print(f"[read_property] Exception: {e}")
-        return PropertyReadResponse(status="error", error=str(e))
+        log.debug("[read_property] Exception: %s", e)
+        return fast_json(PropertyReadResponse.model_construct(status="error", error=str(e)))
+    log.debug("[read_property] Decoded value: %s", value)
+    # --- Normalization logic for response ---
+    # If property is 'object-name', return {"object_name": ...}
+    # If value is {"_value": ...}, return just the value
+    normalized = value
+    if property_identifier.lower().replace("-", "_") == "object_name":
+        # Accept both 'object-name' and 'object_name'
+        if isinstance(value, dict):
+            # Try to extract from common keys
+            for k in ["object-name", "object_name", "_value", "value"]:
+                if k in value:
+                    normalized = {"object_name": value[k]}
+                    break
+            else:
+                normalized = {"object_name": value}
+        else:
+            normalized = {"object_name": value}
+    elif isinstance(value, dict) and set(value.keys()) == {"_value"}:
+        normalized = value["_value"]
+    return fast_json(PropertyReadResponse.model_construct(status="done", result=normalized))
+
 
+# A device's standard property set rarely changes between polls; serve
+# read_device_all from SQLite when the cached copy is this fresh.
+_DEVICE_CACHE_TTL = 30.0
 
-@app.post("/bacnet/read_device_all", response_model=DevicePropertiesResponse)
+# Reading the whole standard property set is the heaviest call here; give
+# it the same generous deadline as the object-list read.
+_DEVICE_READ_TIMEOUT = 120.0
+
+# A proxy build that drops unknown method names never answers the RPM
+# probe, so the probe gets a short deadline of its own, and the first miss
+# is remembered so later cache misses skip straight to READ_DEVICE_ALL.
+_RPM_PROBE_TIMEOUT = 15.0
+_rpm_supported = True
+
+
+def _device_cache_get(device_key: str):
+    """Return the cached properties JSON for device_key, or None if stale."""
+    with Session(engine) as session:
+        row = session.get(DeviceCache, device_key)
+        if row and time.time() - row.ts < _DEVICE_CACHE_TTL:
+            return row.properties_json
+    return None
+
+
+def _device_cache_put(device_key: str, properties_json: str):
+    """Upsert the cached properties JSON for device_key."""
+    with Session(engine) as session:
+        row = session.get(DeviceCache, device_key)
+        if row is None:
+            row = DeviceCache(device_key=device_key, ts=time.time(),
+                              properties_json=properties_json)
+        else:
+            row.ts = time.time()
+            row.properties_json = properties_json
+        session.add(row)
+        session.commit()
+
+
+@app.post("/bacnet/read_device_all", responses={200: {"model": DevicePropertiesResponse}})
 async def read_device_all(device_address: str = Form(...),
                           device_object_identifier: str = Form(...)):
     """
     Read all standard properties from a BACnet device.
     """
-    manager = app.state.bacnet_manager
-    local_addr = app.state.bacnet_proxy_local_address
-    proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
-    peer = manager.ppm.peers.get(proxy_id)
-    if not peer or not peer.socket_params:
-        return DevicePropertiesResponse(
-            status="error",
-            error="Proxy not registered or missing, cannot read device."
-        )
-    from protocol_proxy.ipc import ProtocolProxyMessage
-    import json
     payload = {
         "device_address": device_address,
         "device_object_identifier": device_object_identifier
     }
-    result = await manager.ppm.send(
-        peer.socket_params,
-        ProtocolProxyMessage(method_name="READ_DEVICE_ALL",
-                             payload=json.dumps(payload).encode('utf8'),
-                             response_expected=True))
-    if asyncio.isfuture(result):
-        result = await result
-    print(f"[read_device_all] Raw result bytes: {result}")
+    ident = f"{device_address}:{device_object_identifier}"
+    cached = await asyncio.to_thread(_device_cache_get, ident)
+    if cached is not None:
+        return Response(
+            content=b'{"status":"done","properties":' + cached.encode() + b'}',
+            media_type="application/json")
+    try:
+        await _get_ready_socket_params()
+    except asyncio.TimeoutError:
+        return fast_json(DevicePropertiesResponse.model_construct(
+            status="error",
+            error="Proxy not registered or missing, cannot read device."
+        ))
+    global _rpm_supported
+    try:
+        # Prefer the single ReadPropertyMultiple APDU: one round-trip for
+        # the whole standard property set instead of one per property.
+        value = None
+        if _rpm_supported:
+            try:
+                value = await _coalesced_rpc(f"rpm:{ident}",
+                                             "READ_DEVICE_ALL_RPM", payload,
+                                             reply_timeout=_RPM_PROBE_TIMEOUT)
+            except asyncio.TimeoutError:
+                # No reply at all: assume the proxy drops the method name
+                # and stop probing on later calls.
+                _rpm_supported = False
+            except Exception:
+                pass
+        # Fall back to the per-property path when the proxy or device
+        # can't do RPM (unknown method, SegmentationNotSupported, ...).
+        if value is None or (isinstance(value, dict)
+                             and value.get('status') == 'error'):
+            value = await _coalesced_rpc(f"rda:{ident}",
+                                         "READ_DEVICE_ALL", payload,
+                                         reply_timeout=_DEVICE_READ_TIMEOUT)
+    except asyncio.TimeoutError:
+        return fast_json(DevicePropertiesResponse.model_construct(
+            status="error",
+            error="read_device_all timed out waiting for the device."
+        ))
+    except Exception as e:
+        log.debug("[read_device_all] Error decoding or serializing response: %s", e)
+        return fast_json(DevicePropertiesResponse.model_construct(
+            status="error",
+            error=f"Error decoding read_device_all response: {e}"
+        ))
     try:
-        value = json.loads(result.decode('utf8'))
         jsonable = make_jsonable(value)
-        print(f"[read_device_all FastAPI] Returning to frontend: {jsonable}",
-              50 * "*")
-        return DevicePropertiesResponse(status="done", properties=jsonable)
+        log.debug("[read_device_all] Returning to frontend: %s", jsonable)
+        # Full device reads can be hundreds of fields; encode off-loop.
+        body = await anyio.to_thread.run_sync(orjson.dumps, jsonable)
+        await asyncio.to_thread(_device_cache_put, ident, body.decode())
+        return Response(
+            content=b'{"status":"done","properties":' + body + b'}',
+            media_type="application/json")
     except Exception as e:
-        print(f"[read_device_all] Error decoding or serializing response: {e}")
-        return DevicePropertiesResponse(
+        log.debug("[read_device_all] Error decoding or serializing response: %s", e)
+        return fast_json(DevicePropertiesResponse.model_construct(
             status="error",
             error=f"Error decoding read_device_all response: {e}"
-        )
+        ))
 
 
 #TODO create callbacks
-@app.post("/bacnet/who_is", response_model=WhoIsResponse)
+@app.post("/bacnet/who_is", responses={200: {"model": WhoIsResponse}})
 async def who_is(device_instance_low: int = Form(...),
                  device_instance_high: int = Form(...),
                  dest: str = Form(...)):
     """
     Send a Who-Is request to a BACnet address or range.
     """
-    manager = app.state.bacnet_manager
-    local_addr = app.state.bacnet_proxy_local_address
-    proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
-    peer = manager.ppm.peers.get(proxy_id)
-    if not peer or not peer.socket_params:
-        return WhoIsResponse(
+    payload_bytes = _encode_payload(
+        (("device_instance_low", device_instance_low),
+         ("device_instance_high", device_instance_high), ("dest", dest)))
+    try:
+        result = await _proxy_rpc_raw("WHO_IS", payload_bytes)
+    except ProxyReplyTimeoutError:
+        return fast_json(WhoIsResponse.model_construct(
+            status="error",
+            error="Who-Is timed out waiting for the proxy reply."
+        ))
+    except asyncio.TimeoutError:
+        return fast_json(WhoIsResponse.model_construct(
             status="error",
             error="Proxy not registered or missing, cannot send Who-Is."
-        )
-    from protocol_proxy.ipc import ProtocolProxyMessage
-    import json
-    payload = {
-        "device_instance_low": device_instance_low,
-        "device_instance_high": device_instance_high,
-        "dest": dest
-    }
-    result = await manager.ppm.send(
-        peer.socket_params,
-        ProtocolProxyMessage(method_name="WHO_IS",
-                             payload=json.dumps(payload).encode('utf8'),
-                             response_expected=True))
-    if asyncio.isfuture(result):
-        result = await result
+        ))
+    # The proxy reply is already JSON; when it is the expected device list,
+    # wrap the bytes directly instead of parsing and re-serializing them.
+    if isinstance(result, (bytes, bytearray)) and result.lstrip()[:1] == b'[':
+        return Response(
+            content=b'{"status":"done","devices":' + bytes(result) + b'}',
+            media_type="application/json")
     try:
-        value = json.loads(result.decode('utf8'))
-        return WhoIsResponse(status="done", devices=value)
+        value = orjson.loads(result)
     except Exception as e:
-        return WhoIsResponse(
+        return fast_json(WhoIsResponse.model_construct(
             status="error",
             error=f"Error decoding who_is response: {e}"
-        )
-
-
-# Temporary stubs to avoid NameError in endpoints
-
-device_points = {}
-point_tags = {}
+        ))
+    # The proxy reports failures (e.g. timeouts) as an error dict rather
+    # than a device list; pass those through instead of failing validation.
+    if isinstance(value, dict) and value.get('status') == 'error':
+        return fast_json(WhoIsResponse.model_construct(
+            status="error",
+            error=value.get('error', 'Unknown error')
+        ))
+    # Non-list replies still need coercion of the raw dicts into WhoIsEntry,
+    # so this rare path keeps validated construction.
+    try:
+        return fast_json(WhoIsResponse(status="done", devices=value))
+    except Exception as e:
+        return fast_json(WhoIsResponse.model_construct(
+            status="error",
+            error=f"Error decoding who_is response: {e}"
+        ))
 
 
-@app.post("/ping_ip", response_model=PingResponse)
+@app.post("/ping_ip", responses={200: {"model": PingResponse}})
 async def ping_ip(ip_address: str = Form(...)):
     """
     Ping the given IP address and return the result. Waits for a response, shows loading in UI until done.
     """
-    # Use the system ping command for cross-platform compatibility
-    # -c 1: send 1 packet (Linux/macOS), -W 2: 2 second timeout
-    # For Windows, use '-n 1' and '-w 2000' (ms)
-    import platform
-    import asyncio
-    system = platform.system()
-    if system == "Windows":
-        cmd = ["ping", "-n", "1", "-w", "2000", ip_address]
-    else:
-        cmd = ["ping", "-c", "1", "-W", "2", ip_address]
+    # Prefer the in-process ICMP probe: no fork/exec per request, and many
+    # targets can be probed concurrently on the event loop.
+    if async_ping is not None:
+        try:
+            host = await async_ping(ip_address, count=1, timeout=2,
+                                    privileged=False)
+            if host.is_alive:
+                output = (f"{host.packets_received}/{host.packets_sent} "
+                          f"packets received, avg rtt {host.avg_rtt} ms")
+            else:
+                output = "no reply"
+            return fast_json(PingResponse.model_construct(
+                ip_address=ip_address,
+                success=host.is_alive,
+                output=output
+            ))
+        except SocketPermissionError:
+            # Unprivileged ICMP sockets refused (ping_group_range doesn't
+            # cover this uid, common in containers); use ping(8) instead.
+            pass
+        except Exception as e:
+            return fast_json(PingResponse.model_construct(
+                ip_address=ip_address,
+                success=False,
+                error=str(e)
+            ))
+    # Fall back to the system ping binary if icmplib isn't installed or
+    # can't open an ICMP socket.
     try:
         proc = await asyncio.create_subprocess_exec(
-            *cmd,
+            *_PING_CMD,
+            ip_address,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE)
         stdout, stderr = await proc.communicate()
         success = proc.returncode == 0
         result = stdout.decode() if stdout else stderr.decode()
-        return PingResponse(
+        return fast_json(PingResponse.model_construct(
             ip_address=ip_address,
             success=success,
             output=result.strip()
-        )
+        ))
     except Exception as e:
-        return PingResponse(
+        return fast_json(PingResponse.model_construct(
             ip_address=ip_address,
             success=False,
             error=str(e)
-        )
+        ))
 
 
-@app.post("/stop_proxy", response_model=ProxyResponse)
+@app.post("/stop_proxy", responses={200: {"model": ProxyResponse}})
 async def stop_proxy():
     """
     Stop the running BACnet proxy and clean up state.
     """
     try:
-        if hasattr(app.state,
-                   "bacnet_manager_task") and app.state.bacnet_manager_task:
-            app.state.bacnet_manager_task.cancel()
-            await asyncio.sleep(0.5)
-            app.state.bacnet_manager_task = None
-        if hasattr(app.state, "bacnet_manager"):
-            app.state.bacnet_manager = None
-        if hasattr(app.state, "bacnet_proxy_local_address"):
-            app.state.bacnet_proxy_local_address = None
-        return ProxyResponse(status="done", message="BACnet proxy stopped.")
+        proxy = app.state.proxy
+        async with proxy.lock:
+            if proxy.task:
+                proxy.task.cancel()
+                await asyncio.sleep(0.5)
+                proxy.task = None
+            proxy.manager = None
+            proxy.local_addr = None
+            proxy.ready.clear()
+            proxy.socket_params = None
+            _object_list_cache.clear()
+            _scan_response_cache.clear()
+        return fast_json(ProxyResponse.model_construct(status="done", message="BACnet proxy stopped."))
     except Exception as e:
-        return ProxyResponse(status="error", error=str(e))
+        return fast_json(ProxyResponse.model_construct(status="error", error=str(e)))
 
-from fastapi.responses import JSONResponse
 # TODO make it handle larger responsese from the proxy and implement model
-@app.post("/bacnet/read_object_list_names", response_model=ObjectListNamesResponse)
+@app.post("/bacnet/read_object_list_names",
+          responses={200: {"model": ObjectListNamesResponse}})
 async def read_object_list_names(
     device_address: str = Form(...), 
     device_object_identifier: str = Form(...),
@@ -643,47 +1151,41 @@ async def read_object_list_names(
     """
     # Validate pagination parameters
     if page < 1:
-        return ObjectListNamesResponse(status="error", error="Page number must be 1 or greater")
+        return fast_json(ObjectListNamesResponse.model_construct(
+            status="error", error="Page number must be 1 or greater"))
     if page_size < 1 or page_size > 1000:
-        return ObjectListNamesResponse(status="error", error="Page size must be between 1 and 1000")
-    
-    manager = app.state.bacnet_manager
-    local_addr = app.state.bacnet_proxy_local_address
-    proxy_id = manager.ppm.get_proxy_id((local_addr, 0))
-    peer = manager.ppm.peers.get(proxy_id)
-    if not peer or not peer.socket_params:
-        return ObjectListNamesResponse(status="error", error="Proxy not registered or missing, cannot read object list names.")
-    from protocol_proxy.ipc import ProtocolProxyMessage
-    import json
+        return fast_json(ObjectListNamesResponse.model_construct(
+            status="error", error="Page size must be between 1 and 1000"))
+
+    cache_key = (device_address, device_object_identifier, page, page_size)
+    cached = _object_list_cache.get(cache_key)
+    if cached is not None:
+        # Repeat polls replay the bytes rendered on first access instead
+        # of re-encoding (or re-streaming) the same page.
+        return RawJSONResponse(cached._json_bytes)
+
+    try:
+        await _get_ready_socket_params()
+    except asyncio.TimeoutError:
+        return fast_json(ObjectListNamesResponse.model_construct(
+            status="error",
+            error="Proxy not registered or missing, cannot read object list names."))
     payload = {
         "device_address": device_address,
         "device_object_identifier": device_object_identifier,
         "page": page,
         "page_size": page_size
     }
-    
+
     # Add timeout handling for large responses
     try:
-        result = await asyncio.wait_for(
-            manager.ppm.send(
-                peer.socket_params,
-                ProtocolProxyMessage(method_name="READ_OBJECT_LIST_NAMES",
-                                   payload=json.dumps(payload).encode('utf8'),
-                                   response_expected=True)
-            ),
-            timeout=120  # 2 minutes timeout
-        )
-        
-        if asyncio.isfuture(result):
-            result = await result
-            
-        # Parse the response from the proxy
-        response = json.loads(result.decode('utf8'))
-        
+        response = await _proxy_rpc("READ_OBJECT_LIST_NAMES", payload,
+                                    reply_timeout=120)  # 2 minutes timeout
+
         # Convert to our model format
         if response.get('status') == 'done':
             pagination_data = response.get('pagination', {})
-            pagination = PaginationInfo(
+            pagination = PaginationInfo.model_construct(
                 page=pagination_data.get('page', page),
                 page_size=pagination_data.get('page_size', page_size),
                 total_items=pagination_data.get('total_items', 0),
@@ -692,21 +1194,39 @@ async def read_object_list_names(
                 has_previous=pagination_data.get('has_previous', False)
             )
             
-            # Results are already simple string mapping: object_identifier -> object_name
+            # The proxy sends a simple object_identifier -> object_name
+            # mapping; flatten it into list-of-records for the response.
             results = response.get('results', {})
-            
-            return ObjectListNamesResponse(
+            entries = [
+                ObjectEntry.model_construct(id=key, object_name=name)
+                for key, name in results.items()
+            ]
+
+            resp = ObjectListNamesResponse.model_construct(
                 status="done",
-                results=results,
+                results=entries,
                 pagination=pagination
             )
+            _object_list_cache[cache_key] = resp
+            # Pages are capped at 1000 entries, so render the body in one
+            # pass; the rendered bytes stick to the cached model and are
+            # replayed on repeat polls.
+            return RawJSONResponse(resp._json_bytes)
         else:
-            return ObjectListNamesResponse(
+            return fast_json(ObjectListNamesResponse.model_construct(
                 status="error",
                 error=response.get('error', 'Unknown error occurred')
-            )
-        
+            ))
+
     except asyncio.TimeoutError:
-        return ObjectListNamesResponse(status="error", error="Request timed out after 2 minutes")
+        return fast_json(ObjectListNamesResponse.model_construct(
+            status="error", error="Request timed out after 2 minutes"))
     except Exception as e:
-        return ObjectListNamesResponse(status="error", error=str(e))
\ No newline at end of file
+        return fast_json(ObjectListNamesResponse.model_construct(status="error", error=str(e)))
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvicorn picks uvloop and httptools automatically when installed;
+    # the event loop is the hot path for this IO-bound service.
+    uvicorn.run("bacnet_scan_tool.main:app", host="0.0.0.0", port=8000)
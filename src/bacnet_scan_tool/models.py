@@ -1,59 +1,106 @@
+from functools import cached_property
+
 from sqlmodel import SQLModel, Field
-from typing import Optional, List, Any, Dict
-from pydantic import BaseModel
+from typing import Optional, List, Any, Dict, Literal
+from pydantic import BaseModel, ConfigDict
+
+# Response models are built once and never mutated; freezing them lets
+# Pydantic skip mutable-field setup and ignoring extras keeps validation
+# from choking on fields the proxy may add.
+_RESPONSE_CONFIG = ConfigDict(frozen=True, extra='ignore')
+
+# Hot sub-models are built per device/page row, so also skip validating
+# their (constant, already well-typed) defaults on every instantiation.
+_ROW_CONFIG = ConfigDict(frozen=True, extra='ignore', validate_default=False)
+
+# These fields take values from tiny fixed sets; Literal lets pydantic-core
+# validate them with an interned-string compare instead of general str checks.
+Status = Literal["done", "error"]
+Segmentation = Literal["segmentedBoth", "segmentedTransmit",
+                       "segmentedReceive", "noSegmentation"]
+
+# Mixin for models that get cached and re-served: the first serialization
+# is remembered on the instance, so repeat polls cost one attribute read.
+# cached_property stores straight into __dict__, so it works on frozen
+# models too; invalidation is just dropping the instance from its cache.
+class JsonCachedModel(BaseModel):
+    @cached_property
+    def _json_bytes(self) -> bytes:
+        return self.model_dump_json(exclude_none=True).encode()
 
 class IPAddress(BaseModel):
+    model_config = _RESPONSE_CONFIG
     address: str
 
 class LocalIPResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
     local_ip: str
     subnet_mask: Optional[str] = None
     cidr: Optional[str] = None
     error: Optional[str] = None
 
 class ProxyResponse(BaseModel):
-    status: str
+    model_config = _RESPONSE_CONFIG
+    status: Status
     address: Optional[str] = None
     message: Optional[str] = None
     error: Optional[str] = None
 
 # Used for scan responses
 class BACnetDevice(BaseModel):
+    model_config = _ROW_CONFIG
     device_instance: int
     deviceIdentifier: str
     address: Optional[str] = None
     maxAPDULengthAccepted: Optional[int] = None
-    segmentationSupported: Optional[str] = None
+    segmentationSupported: Optional[Segmentation] = None
     vendorID: Optional[int] = None
 
 class ScanResponse(BaseModel):
-    status: str
+    model_config = _RESPONSE_CONFIG
+    status: Status
     devices: Optional[List[BACnetDevice]] = None
     error: Optional[str] = None
     ips_scanned: int
 
 class PropertyReadResponse(BaseModel):
-    status: str
+    model_config = _RESPONSE_CONFIG
+    status: Status
     result: Optional[Any] = None
     error: Optional[str] = None
 
 class DevicePropertiesResponse(BaseModel):
-    status: str
+    model_config = _RESPONSE_CONFIG
+    status: Status
     properties: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
+# One I-Am entry as the proxy reports it. Typing the fields lets
+# pydantic-core serialize Who-Is results natively instead of walking
+# Any-typed dicts, and documents the wire shape in OpenAPI.
+class WhoIsEntry(BaseModel):
+    model_config = _ROW_CONFIG
+    pduSource: Optional[str] = None
+    deviceIdentifier: Optional[List[Any]] = None  # e.g. ["device", 123]
+    maxAPDULengthAccepted: Optional[int] = None
+    segmentationSupported: Optional[Segmentation] = None
+    vendorID: Optional[int] = None
+
 class WhoIsResponse(BaseModel):
-    status: str
-    devices: Optional[List[Dict[str, Any]]] = None
+    model_config = _RESPONSE_CONFIG
+    status: Status
+    devices: Optional[List[WhoIsEntry]] = None
     error: Optional[str] = None
 
 class PingResponse(BaseModel):
+    model_config = _RESPONSE_CONFIG
     ip_address: str
     success: bool
     output: Optional[str] = None
     error: Optional[str] = None
 
 class PaginationInfo(BaseModel):
+    model_config = _ROW_CONFIG
     page: int
     page_size: int
     total_items: int
@@ -61,8 +108,24 @@ class PaginationInfo(BaseModel):
     has_next: bool
     has_previous: bool
 
-class ObjectListNamesResponse(BaseModel):
-    status: str
-    results: Optional[Dict[str, str]] = None  # object_identifier -> object_name mapping
+# Last decoded read_device_all result per device, persisted so repeated UI
+# polls hit SQLite instead of re-reading hundreds of properties over BACnet.
+class DeviceCache(SQLModel, table=True):
+    device_key: str = Field(primary_key=True)
+    ts: float
+    properties_json: str
+
+# One object-list row. A list of records serializes faster than a dict
+# keyed by object identifier — no per-key hashing or escaping pass — and
+# the frontend iterates it contiguously.
+class ObjectEntry(BaseModel):
+    model_config = _ROW_CONFIG
+    id: str  # object identifier, e.g. "analog-input,1"
+    object_name: str
+
+class ObjectListNamesResponse(JsonCachedModel):
+    model_config = _RESPONSE_CONFIG
+    status: Status
+    results: Optional[List[ObjectEntry]] = None
     pagination: Optional[PaginationInfo] = None
-    error: Optional[str] = None
+    error: Optional[str] = None
\ No newline at end of file
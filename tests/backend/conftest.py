@@ -0,0 +1,39 @@
+import pytest
+from fastapi.testclient import TestClient
+
+# Import your FastAPI app
+from bacnet_scan_tool.main import app
+
+# API endpoint constants
+TOOL_NAME = "bacnet"
+SCAN_ENDPOINT = f"/{TOOL_NAME}/scan/start"
+DEVICES_ENDPOINT = "/devices"
+POINTS_ENDPOINT = "/points"
+VALUES_ENDPOINT = "/points/values"
+META_ENDPOINT = "/points/meta"
+TAGS_ENDPOINT = "/tags"
+WRITE_ENDPOINT = "/write"
+
+# Test data constants
+TEST_IP_RANGE = "192.168.1.0/24"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session; entering the context manager
+    runs the app lifespan once instead of once per test."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def run_fake_scan(client):
+    """Run a fake scan once per session to populate test data"""
+    response = client.get(SCAN_ENDPOINT,
+                          params={
+                              "ip_address": TEST_IP_RANGE,
+                              "fake": "true"
+                          })
+    assert response.status_code == 200
+    assert "device_id" in response.json()
+    return response.json()["device_id"]
@@ -1,40 +1,20 @@
 import pytest
-from fastapi.testclient import TestClient
 
-# Import your FastAPI app
-from bacnet_scan_tool.main import app
-
-# Create test client
-client = TestClient(app)
-
-# API endpoint constants
-TOOL_NAME = "bacnet"
-SCAN_ENDPOINT = f"/{TOOL_NAME}/scan/start"
-DEVICES_ENDPOINT = "/devices"
-POINTS_ENDPOINT = "/points"
-VALUES_ENDPOINT = "/points/values"
-META_ENDPOINT = "/points/meta"
-TAGS_ENDPOINT = "/tags"
-WRITE_ENDPOINT = "/write"
-
-# Test data constants
-TEST_IP_RANGE = "192.168.1.0/24"
+from conftest import (DEVICES_ENDPOINT, META_ENDPOINT, POINTS_ENDPOINT,
+                      SCAN_ENDPOINT, TAGS_ENDPOINT, TEST_IP_RANGE,
+                      VALUES_ENDPOINT, WRITE_ENDPOINT)
 
 
 @pytest.fixture
-def run_fake_scan():
-    """Run a fake scan to populate data structures with test data"""
-    response = client.get(SCAN_ENDPOINT,
-                          params={
-                              "ip_address": TEST_IP_RANGE,
-                              "fake": "true"
-                          })
+def point_id(client, run_fake_scan):
+    """First point id of the fake-scanned device"""
+    response = client.get(
+        f"{DEVICES_ENDPOINT}/{run_fake_scan}{POINTS_ENDPOINT}")
     assert response.status_code == 200
-    assert "device_id" in response.json()
-    return response.json()["device_id"]
+    return response.json()["points"][0]["id"]
 
 
-def test_start_bacnet_discovery():
+def test_start_bacnet_discovery(client):
     """Test starting a BACnet scan"""
     response = client.get(SCAN_ENDPOINT,
                           params={
@@ -47,7 +27,7 @@ def test_start_bacnet_discovery():
     assert "message" in result
 
 
-def test_get_devices(run_fake_scan):
+def test_get_devices(client, run_fake_scan):
     """Test retrieving devices after a scan"""
     response = client.get(DEVICES_ENDPOINT)
     assert response.status_code == 200
@@ -60,56 +40,31 @@ def test_get_devices(run_fake_scan):
     assert "ip_address" in device
 
 
-def test_get_device_points(run_fake_scan):
-    """Test retrieving points for a specific device"""
-    device_id = run_fake_scan
-    response = client.get(f"{DEVICES_ENDPOINT}/{device_id}{POINTS_ENDPOINT}")
-    assert response.status_code == 200
-    result = response.json()
-    assert "points" in result
-    assert len(result["points"]) > 0
-    # Check for expected point fields
-    point = result["points"][0]
-    assert "id" in point
-    assert "name" in point
-    assert "device_id" in point
-
-
-def test_get_point_values(run_fake_scan):
-    """Test retrieving values for all points of a device"""
+@pytest.mark.parametrize(
+    "endpoint,expected_key,item_keys",
+    [(POINTS_ENDPOINT, "points", ("id", "name", "device_id")),
+     (VALUES_ENDPOINT, "values", ("value",)),
+     (META_ENDPOINT, "metadata", ())])
+def test_get_device_subresource(client, run_fake_scan, endpoint, expected_key,
+                                item_keys):
+    """Test retrieving points/values/metadata for a specific device"""
     device_id = run_fake_scan
-    response = client.get(f"{DEVICES_ENDPOINT}/{device_id}{VALUES_ENDPOINT}")
+    response = client.get(f"{DEVICES_ENDPOINT}/{device_id}{endpoint}")
     assert response.status_code == 200
     result = response.json()
-    assert "values" in result
-    # Values should be a dictionary with point_id keys
-    assert len(result["values"]) > 0
-    # Get first point_id and value
-    point_id = list(result["values"].keys())[0]
-    point_data = result["values"][point_id]
-    assert "value" in point_data
+    assert expected_key in result
+    items = result[expected_key]
+    assert len(items) > 0
+    # Check expected fields on the first entry (list of points or a dict
+    # keyed by point_id, depending on the endpoint)
+    first = items[0] if isinstance(items, list) else next(iter(items.values()))
+    for key in item_keys:
+        assert key in first
 
 
-def test_get_point_metadata(run_fake_scan):
-    """Test retrieving metadata for all points of a device"""
-    device_id = run_fake_scan
-    response = client.get(f"{DEVICES_ENDPOINT}/{device_id}{META_ENDPOINT}")
-    assert response.status_code == 200
-    result = response.json()
-    assert "metadata" in result
-    # Metadata should be a dictionary with point_id keys
-    assert len(result["metadata"]) > 0
-
-
-def test_create_point_tag(run_fake_scan):
+def test_create_point_tag(client, run_fake_scan, point_id):
     """Test creating a tag for a specific point"""
     device_id = run_fake_scan
-    # Get a point ID first
-    points_response = client.get(
-        f"{DEVICES_ENDPOINT}/{device_id}{POINTS_ENDPOINT}")
-    assert points_response.status_code == 200
-    point_id = points_response.json()["points"][0]["id"]
-
     # Create a tag
     tag_data = {"name": "test_tag"}
     response = client.post(
@@ -121,15 +76,9 @@ def test_create_point_tag(run_fake_scan):
     assert "message" in result
 
 
-def test_get_point_tags(run_fake_scan):
+def test_get_point_tags(client, run_fake_scan, point_id):
     """Test retrieving tags for a specific point"""
     device_id = run_fake_scan
-    # Get a point ID first
-    points_response = client.get(
-        f"{DEVICES_ENDPOINT}/{device_id}{POINTS_ENDPOINT}")
-    assert points_response.status_code == 200
-    point_id = points_response.json()["points"][0]["id"]
-
     # First add a tag
     tag_data = {"name": "test_tag"}
     client.post(
@@ -145,15 +94,9 @@ def test_get_point_tags(run_fake_scan):
     assert "test_tag" in result["tags"]
 
 
-def test_write_point_value(run_fake_scan):
+def test_write_point_value(client, run_fake_scan, point_id):
     """Test writing a value to a specific point"""
     device_id = run_fake_scan
-    # Get a point ID first
-    points_response = client.get(
-        f"{DEVICES_ENDPOINT}/{device_id}{POINTS_ENDPOINT}")
-    assert points_response.status_code == 200
-    point_id = points_response.json()["points"][0]["id"]
-
     # Write a value to the point
     write_data = {"value": 72.5}
     response = client.put(
@@ -164,14 +107,14 @@ def test_write_point_value(run_fake_scan):
     assert "message" in result
 
 
-def test_nonexistent_device():
+def test_nonexistent_device(client):
     """Test accessing a device that doesn't exist"""
     response = client.get(f"{DEVICES_ENDPOINT}/99999{POINTS_ENDPOINT}")
     assert response.status_code == 404
     assert "not found" in response.json()["detail"].lower()
 
 
-def test_invalid_tool_name():
+def test_invalid_tool_name(client):
     """Test using an invalid tool name"""
     response = client.get("/invalid-tool/scan/start",
                           params={"ip_address": TEST_IP_RANGE})